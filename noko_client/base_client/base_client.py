@@ -3,22 +3,58 @@
 Handle the HTTP request to the Noko API.
 """
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from noko_client import __version__
+from noko_client.exceptions import ChunkedRequestError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: dict) -> bytes:
+    # Serialise the request body with orjson if installed, falling back to the standard library otherwise.
+    if orjson is not None:
+        return orjson.dumps(obj)  # pylint: disable=no-member
+    return json.dumps(obj).encode()
 
 
 class BaseClient:
     """Base client for the Noko API."""
 
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, pool_size: int = 8):
         """Initialise an instance of the BaseClient.
 
+        All requests share a single session, so connections to Noko are reused between calls. Requests that fail
+        with a rate limit or gateway error (429, 502, 503 or 504) are retried up to 3 times with an exponential
+        backoff. POST requests are not retried on error status codes.
+
         Args:
             access_token (str): The Noko access token to authenticate the requests.
+            pool_size (int): The maximum number of connections to keep open to Noko, so that concurrent requests
+                can reuse them. Also caps the number of chunked requests run at the same time. Defaults to 8.
         """
         self.access_token = access_token
+        self.pool_size = pool_size
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
+        )
 
     def fetch_json(
         self,
@@ -58,6 +94,7 @@ class BaseClient:
 
         # set content type and accept headers to handle JSON
         headers["Accept"] = "application/json"
+        headers["Content-Type"] = "application/json"
         headers["User-Agent"] = f"python-freckle-client/{__version__}"
         headers["X-FreckleToken"] = self.access_token
 
@@ -70,10 +107,71 @@ class BaseClient:
         # otherwise return None
         return response
 
+    def fetch_json_concurrently(
+        self,
+        uri_path: str,
+        http_method: str,
+        post_args_list: list[dict],
+        max_concurrency: int = 8,
+    ) -> list[list[dict] | None]:
+        """Make the same request to Noko once for each set of POST arguments, with the requests running concurrently.
+
+        Used to split bulk requests into smaller chunks, for example:
+
+            self.fetch_json_concurrently(
+                'entries/approved',
+                'PUT',
+                post_args_list=[{'entry_ids': [1, 2]}, {'entry_ids': [3, 4]}],
+            )
+
+        All requests are always made, even if some of them fail. If any request fails, the others may still have
+        been applied by Noko, and a single `ChunkedRequestError` listing the parameters of every failed request is
+        raised once all of them have finished.
+
+        Args:
+            uri_path (str): The Noko endpoint to make the requests to.
+            http_method (str): The HTTP verb to use in the requests.
+            post_args_list (list[dict]): A list of dictionaries of parameters, one for each request to make.
+            max_concurrency (int): The maximum number of requests to run at the same time. Must be at least 1.
+                Capped at the client's `pool_size`, so every request can use a pooled connection. Defaults to 8.
+
+        Returns:
+            (list[list[dict] | None]): The response of each request, in the same order as `post_args_list`.
+        """
+        if len(post_args_list) == 1:
+            return [self.fetch_json(uri_path, http_method, post_args=post_args_list[0])]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, self.pool_size)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.fetch_json, uri_path, http_method, post_args=post_args
+                )
+                for post_args in post_args_list
+            ]
+            wait(futures)
+
+        failed_post_args = []
+        errors = []
+        for post_args, future in zip(post_args_list, futures):
+            error = future.exception()
+            if error is not None:
+                failed_post_args.append(post_args)
+                errors.append(error)
+        if errors:
+            raise ChunkedRequestError(
+                f"{len(errors)} of {len(post_args_list)} requests to {uri_path} failed, the other requests "
+                f"succeeded. Failed requests: {failed_post_args}",
+                failed_post_args,
+                errors,
+            ) from errors[0]
+        return [future.result() for future in futures]
+
     # private
 
-    @staticmethod
     def _make_request(
+        self,
         http_method: str,
         url: str,
         headers: dict,
@@ -83,12 +181,12 @@ class BaseClient:
         # Make the HTTP request to the Noko API and provide the response.
         results: list = []
         while url:
-            response = requests.request(
+            response = self._session.request(
                 http_method,
                 url,
                 params=query_params,
                 headers=headers,
-                data=json.dumps(post_args),
+                data=_dumps(post_args),
             )
             # if request failed (i.e. HTTP status code not 20x),
             # raise appropriate error
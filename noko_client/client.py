@@ -8,30 +8,13 @@ References
 """
 # mypy: disable-error-code="return-value, arg-type"
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
+from pydantic import BaseModel
+
+from noko_client import schemas
 from noko_client.base_client import BaseClient
-from noko_client.schemas import (
-    CreateNokoEntryParameters,
-    CreateNokoExpenseParameters,
-    CreateNokoInvoiceParameters,
-    CreateNokoProjectGroupsParameters,
-    CreateNokoProjectParameters,
-    CreateNokoTeamParameters,
-    CreateNokoUserParameters,
-    EditNokoEntryParameters,
-    EditNokoExpenseParameters,
-    EditNokoInvoiceParameters,
-    EditNokoProjectParameters,
-    EditNokoUserParameters,
-    GetNokoEntriesParameters,
-    GetNokoExpensesParameters,
-    GetNokoInvoicesParameters,
-    GetNokoProjectGroupsParameters,
-    GetNokoProjectsParameters,
-    GetNokoTagsParameters,
-    GetNokoTeamsParameters,
-    GetNokoUsersParameters,
-)
 from noko_client.schemas.utilities import (
     date_to_string,
     list_to_list_of_integers,
@@ -40,6 +23,83 @@ from noko_client.schemas.utilities import (
 )
 
 
+def _validate_parameters(model: type[BaseModel], kwargs: dict) -> dict:
+    # Validate the keyword arguments with the model's schema validator and dump the resulting instance.
+    # Calling the validator directly skips the `BaseModel.__init__` call made for every request.
+    return model.__pydantic_validator__.validate_python(kwargs).model_dump()
+
+
+def _is_cacheable(value: object) -> bool:
+    # Only exact `str` and `int` values (not `bool`, which compares equal to `int`) or None are safe as cache keys.
+    # Other types, such as timezone-aware datetimes, can compare equal while validating to different parameters.
+    return value is None or type(value) in (str, int)
+
+
+def _freeze_kwargs(kwargs: dict) -> tuple | None:
+    # Build a cache key for the keyword arguments, tagging each value with its type so equal values of different
+    # types never share an entry. Returns None if any of the values is not safe to cache.
+    frozen_kwargs = []
+    for key, value in sorted(kwargs.items()):
+        if isinstance(value, list):
+            if not all(_is_cacheable(item) for item in value):
+                return None
+            frozen_kwargs.append(
+                (key, list, tuple((type(item), item) for item in value))
+            )
+        elif _is_cacheable(value):
+            frozen_kwargs.append((key, type(value), value))
+        else:
+            return None
+    return tuple(frozen_kwargs)
+
+
+@lru_cache(maxsize=256)
+def _cached_model_dump(model: type[BaseModel], frozen_kwargs: tuple) -> tuple:
+    # Validate and dump the parameters for a given set of frozen keyword arguments.
+    kwargs = {
+        key: [item for _, item in value] if kind is list else value
+        for key, kind, value in frozen_kwargs
+    }
+    return tuple(_validate_parameters(model, kwargs).items())
+
+
+def _dump_parameters(model: type[BaseModel], kwargs: dict) -> dict:
+    # Return the validated parameters for the model, reusing previous results for identical keyword arguments.
+    # Falls back to a fresh validation if any of the values is not safe to cache.
+    frozen_kwargs = _freeze_kwargs(kwargs)
+    if frozen_kwargs is None:
+        return _validate_parameters(model, kwargs)
+    return dict(_cached_model_dump(model, frozen_kwargs))
+
+
+def _drop_none(params: dict) -> dict:
+    # Remove the parameters explicitly set to None, which Noko ignores, so they are left out of validation
+    # and of the cache key.
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _check_chunking(chunk_size: int, max_concurrency: int) -> None:
+    # Fail early on chunking settings that would otherwise disable chunking or fail deep in the executor.
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+
+def _chunk_post_args(post_args: dict, key: str, chunk_size: int) -> list[dict]:
+    # Split the list under `key` into chunks of at most `chunk_size` items, one copy of the POST arguments per chunk.
+    values = iter(post_args[key])
+    chunks = []
+    while chunk := list(islice(values, chunk_size)):
+        chunks.append({**post_args, key: chunk})
+    return chunks or [post_args]
+
+
+# Parameters for requests made without any filters, validated once at import time.
+_EMPTY_ENTRIES_PARAMS = _validate_parameters(schemas.GetNokoEntriesParameters, {})
+_EMPTY_TAGS_PARAMS = _validate_parameters(schemas.GetNokoTagsParameters, {})
+
+
 class NokoClient(BaseClient):
     """Simple Client for the Noko API.
 
@@ -51,6 +111,7 @@ class NokoClient(BaseClient):
 
     Attributes:
         access_token (str): The Noko access token to authenticate the requests.
+        pool_size (int): The maximum number of connections kept open to Noko, which also caps concurrent requests.
     """
 
     # Entry related methods
@@ -85,11 +146,18 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): The complete response from Noko as a list of dictionaries.
         """
-        params = GetNokoEntriesParameters(**kwargs).model_dump()
+        kwargs = _drop_none(kwargs)
+        params = (
+            _dump_parameters(schemas.GetNokoEntriesParameters, kwargs)
+            if kwargs
+            else _EMPTY_ENTRIES_PARAMS
+        )
         return self.fetch_json("entries", http_method="GET", query_params=params)
 
     def get_single_entry(self, entry_id: str | int) -> list[dict]:
@@ -124,7 +192,9 @@ class NokoClient(BaseClient):
         Returns:
             (dict): The entry created with the provided information as a dictionary.
         """
-        data = CreateNokoEntryParameters(**kwargs).model_dump()
+        data = _validate_parameters(
+            schemas.CreateNokoEntryParameters, _drop_none(kwargs)
+        )
         return self.fetch_json("entries", post_args=data, http_method="POST")
 
     def edit_entry(self, entry_id: int | str, **kwargs) -> list[dict]:
@@ -155,37 +225,109 @@ class NokoClient(BaseClient):
         Returns:
             (dict): The edited entry with the provided information as a dictionary.
         """
-        data = EditNokoEntryParameters(**kwargs).model_dump()
+        data = _validate_parameters(schemas.EditNokoEntryParameters, _drop_none(kwargs))
         return self.fetch_json(f"entries/{entry_id}", post_args=data, http_method="PUT")
 
     def mark_as_invoiced(
-        self, entry_ids: int | str | list[int] | list[str], date: str | datetime
+        self,
+        entry_ids: int | str | list[int] | list[str],
+        date: str | datetime,
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
     ) -> None:
         """Mark an entry or a list of entries as invoiced outside of Noko.
 
         If an entry has already been marked as invoiced outside of noko, the action will modify the `invoiced_at`
         date for that entry.
 
+        Delegates to `mark_single_entry_as_invoiced` or `mark_entries_as_invoiced` depending on whether a single ID
+        or a list of IDs is provided. Call those directly when the type of `entry_ids` is known in advance.
+
         Args:
             entry_ids (int | str | list[int] | list[str]): The ID of the entry (or entries) to mark as invoiced.
             date (str | datetime): The date to mark the entry as invoiced at. If provided as string, must be
                 in ISO 8601 format (YYYY-MM-DD).
+            chunk_size (int): If a list of IDs is provided, the maximum number of IDs to send per request. Longer
+                lists are split into several requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
 
         Returns:
             (None): If unsuccessful, will raise an exception.
         """
-        date = date_to_string(date)
-        post_args = {"date": date}
-        uri = f"entries/{entry_ids}/mark_as_invoiced"
         if isinstance(entry_ids, list):
-            uri = "entries/mark_as_invoiced"
-            post_args["entry_ids"] = list_to_list_of_integers(entry_ids)  # type: ignore[assignment]
-        self.fetch_json(uri, post_args=post_args, http_method="PUT")
+            self.mark_entries_as_invoiced(entry_ids, date, chunk_size, max_concurrency)
+        else:
+            self.mark_single_entry_as_invoiced(entry_ids, date)
+
+    def mark_single_entry_as_invoiced(
+        self, entry_id: int | str, date: str | datetime
+    ) -> None:
+        """Mark a single entry as invoiced outside of Noko.
+
+        If the entry has already been marked as invoiced outside of noko, the action will modify the `invoiced_at`
+        date for that entry.
+
+        Args:
+            entry_id (int | str): The ID of the entry to mark as invoiced.
+            date (str | datetime): The date to mark the entry as invoiced at. If provided as string, must be
+                in ISO 8601 format (YYYY-MM-DD).
+
+        Returns:
+            (None): If unsuccessful, will raise an exception.
+        """
+        self.fetch_json(
+            f"entries/{entry_id}/mark_as_invoiced",
+            post_args={"date": date_to_string(date)},
+            http_method="PUT",
+        )
+
+    def mark_entries_as_invoiced(
+        self,
+        entry_ids: list[int] | list[str],
+        date: str | datetime,
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Mark a list of entries as invoiced outside of Noko.
+
+        If an entry has already been marked as invoiced outside of noko, the action will modify the `invoiced_at`
+        date for that entry.
+
+        If the IDs are split into several requests and any of them fails, the other requests are still made and
+        may have been applied, leaving the work partly done. A `ChunkedRequestError` listing the IDs of the failed
+        requests is raised once all of them have finished.
+
+        Args:
+            entry_ids (list[int] | list[str]): The IDs of the entries to mark as invoiced.
+            date (str | datetime): The date to mark the entries as invoiced at. If provided as string, must be
+                in ISO 8601 format (YYYY-MM-DD).
+            chunk_size (int): The maximum number of IDs to send per request. Longer lists are split into several
+                requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
+
+        Returns:
+            (None): If unsuccessful, will raise an exception.
+        """
+        _check_chunking(chunk_size, max_concurrency)
+        post_args = {
+            "date": date_to_string(date),
+            "entry_ids": list(dict.fromkeys(list_to_list_of_integers(entry_ids))),
+        }
+        self.fetch_json_concurrently(
+            "entries/mark_as_invoiced",
+            "PUT",
+            _chunk_post_args(post_args, "entry_ids", chunk_size),
+            max_concurrency,
+        )
 
     def mark_as_approved(
         self,
         entry_ids: int | str | list[int | str],
         approved_at: str | datetime | None = None,
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
     ) -> None:
         """Mark an entry or a list of entries as approved.
 
@@ -197,23 +339,96 @@ class NokoClient(BaseClient):
         Any entries in a bulk request that cannot be edited or approved will be ignored and will not cause
         an unsuccessful response.
 
+        Delegates to `mark_single_entry_as_approved` or `mark_entries_as_approved` depending on whether a single ID
+        or a list of IDs is provided. Call those directly when the type of `entry_ids` is known in advance.
+
         Args:
             entry_ids (int | str | list[int] | list[str]): The ID of the entry (or entries) to mark as invoiced.
             approved_at (str | datetime | None): The timestamp for when the entry was approved. If provided as string,
             must be in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ). If not provided, current time will be used.
+            chunk_size (int): If a list of IDs is provided, the maximum number of IDs to send per request. Longer
+                lists are split into several requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
 
         Returns:
             (None): If unsuccessful, will raise an exception.
         """
-        approved_at = timestamp_to_string(approved_at)
-        uri = f"entries/{entry_ids}/approved"
-        post_args = {"approved_at": approved_at}
         if isinstance(entry_ids, list):
-            uri = "entries/approved"
-            post_args["entry_ids"] = list_to_list_of_integers(entry_ids)  # type: ignore[assignment]
-        self.fetch_json(uri, post_args=post_args, http_method="PUT")
+            self.mark_entries_as_approved(
+                entry_ids, approved_at, chunk_size, max_concurrency
+            )
+        else:
+            self.mark_single_entry_as_approved(entry_ids, approved_at)
+
+    def mark_single_entry_as_approved(
+        self, entry_id: int | str, approved_at: str | datetime | None = None
+    ) -> None:
+        """Mark a single entry as approved.
 
-    def mark_as_unapproved(self, entry_ids: int | str | list[int | str]) -> None:
+        Approved entries cannot be edited or deleted. If the entry is associated with an archived project or is
+        already approved, the request will fail.
+
+        Args:
+            entry_id (int | str): The ID of the entry to mark as approved.
+            approved_at (str | datetime | None): The timestamp for when the entry was approved. If provided as string,
+            must be in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ). If not provided, current time will be used.
+
+        Returns:
+            (None): If unsuccessful, will raise an exception.
+        """
+        self.fetch_json(
+            f"entries/{entry_id}/approved",
+            post_args={"approved_at": timestamp_to_string(approved_at)},
+            http_method="PUT",
+        )
+
+    def mark_entries_as_approved(
+        self,
+        entry_ids: list[int | str],
+        approved_at: str | datetime | None = None,
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Mark a list of entries as approved.
+
+        Approved entries cannot be edited or deleted. Any entries that cannot be edited or approved will be ignored
+        and will not cause an unsuccessful response.
+
+        If the IDs are split into several requests and any of them fails, the other requests are still made and
+        may have been applied, leaving the work partly done. A `ChunkedRequestError` listing the IDs of the failed
+        requests is raised once all of them have finished.
+
+        Args:
+            entry_ids (list[int | str]): The IDs of the entries to mark as approved.
+            approved_at (str | datetime | None): The timestamp for when the entries were approved. If provided as
+            string, must be in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ). If not provided, current time will be used.
+            chunk_size (int): The maximum number of IDs to send per request. Longer lists are split into several
+                requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
+
+        Returns:
+            (None): If unsuccessful, will raise an exception.
+        """
+        _check_chunking(chunk_size, max_concurrency)
+        post_args = {
+            "approved_at": timestamp_to_string(approved_at),
+            "entry_ids": list(dict.fromkeys(list_to_list_of_integers(entry_ids))),
+        }
+        self.fetch_json_concurrently(
+            "entries/approved",
+            "PUT",
+            _chunk_post_args(post_args, "entry_ids", chunk_size),
+            max_concurrency,
+        )
+
+    def mark_as_unapproved(
+        self,
+        entry_ids: int | str | list[int | str],
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+    ) -> None:
         """Mark an entry or a list of entries as unapproved.
 
         Unapproved entries can be edited or deleted.
@@ -223,18 +438,75 @@ class NokoClient(BaseClient):
         Any entries in a bulk request that cannot be edited or unapproved will be ignored and will not cause
         an unsuccessful response.
 
+        Delegates to `mark_single_entry_as_unapproved` or `mark_entries_as_unapproved` depending on whether a single
+        ID or a list of IDs is provided. Call those directly when the type of `entry_ids` is known in advance.
+
         Args:
             entry_ids (int | str | list[int] | list[str]): The ID of the entry (or entries) to mark as invoiced.
+            chunk_size (int): If a list of IDs is provided, the maximum number of IDs to send per request. Longer
+                lists are split into several requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
 
         Returns:
             (None): If unsuccessful, will raise an exception.
         """
-        uri = f"entries/{entry_ids}/unapproved"
-        post_args = {}
         if isinstance(entry_ids, list):
-            uri = "entries/unapproved"
-            post_args["entry_ids"] = list_to_list_of_integers(entry_ids)
-        self.fetch_json(uri, post_args=post_args, http_method="PUT")
+            self.mark_entries_as_unapproved(entry_ids, chunk_size, max_concurrency)
+        else:
+            self.mark_single_entry_as_unapproved(entry_ids)
+
+    def mark_single_entry_as_unapproved(self, entry_id: int | str) -> None:
+        """Mark a single entry as unapproved.
+
+        Unapproved entries can be edited or deleted. If the entry is associated with an archived project, the
+        request will fail.
+
+        Args:
+            entry_id (int | str): The ID of the entry to mark as unapproved.
+
+        Returns:
+            (None): If unsuccessful, will raise an exception.
+        """
+        self.fetch_json(
+            f"entries/{entry_id}/unapproved", post_args={}, http_method="PUT"
+        )
+
+    def mark_entries_as_unapproved(
+        self,
+        entry_ids: list[int | str],
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Mark a list of entries as unapproved.
+
+        Unapproved entries can be edited or deleted. Any entries that cannot be edited or unapproved will be ignored
+        and will not cause an unsuccessful response.
+
+        If the IDs are split into several requests and any of them fails, the other requests are still made and
+        may have been applied, leaving the work partly done. A `ChunkedRequestError` listing the IDs of the failed
+        requests is raised once all of them have finished.
+
+        Args:
+            entry_ids (list[int | str]): The IDs of the entries to mark as unapproved.
+            chunk_size (int): The maximum number of IDs to send per request. Longer lists are split into several
+                requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
+
+        Returns:
+            (None): If unsuccessful, will raise an exception.
+        """
+        _check_chunking(chunk_size, max_concurrency)
+        post_args = {
+            "entry_ids": list(dict.fromkeys(list_to_list_of_integers(entry_ids)))
+        }
+        self.fetch_json_concurrently(
+            "entries/unapproved",
+            "PUT",
+            _chunk_post_args(post_args, "entry_ids", chunk_size),
+            max_concurrency,
+        )
 
     def delete_entry(self, entry_id: str | int) -> None:
         """Delete a time entry.
@@ -264,7 +536,12 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): All retrieved tags as a list of dictionaries.
         """
-        params = GetNokoTagsParameters(**kwargs).model_dump()
+        kwargs = _drop_none(kwargs)
+        params = (
+            _dump_parameters(schemas.GetNokoTagsParameters, kwargs)
+            if kwargs
+            else _EMPTY_TAGS_PARAMS
+        )
         return self.fetch_json("tags", query_params=params, http_method="GET")
 
     def create_tags(self, names: list[str]) -> list[dict]:
@@ -326,11 +603,18 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): A list of all retrieved entries meeting the specified criteria.
         """
-        params = GetNokoEntriesParameters(**kwargs).model_dump()
+        kwargs = _drop_none(kwargs)
+        params = (
+            _dump_parameters(schemas.GetNokoEntriesParameters, kwargs)
+            if kwargs
+            else _EMPTY_ENTRIES_PARAMS
+        )
         return self.fetch_json(
             f"tags/{tag_id}/entries", query_params=params, http_method="GET"
         )
@@ -386,7 +670,9 @@ class NokoClient(BaseClient):
         """
         self.fetch_json(f"tags/{tag_id}", http_method="DELETE")
 
-    def delete_tags(self, tag_ids: list[str | int]) -> None:
+    def delete_tags(
+        self, tag_ids: list[str | int], chunk_size: int = 500, max_concurrency: int = 8
+    ) -> None:
         """Delete multiple tags at once.
 
         When a tag is deleted, entries associated with it are not deleted. This action will, however, affect their
@@ -395,15 +681,27 @@ class NokoClient(BaseClient):
         If one of the tags in the provided list of IDs cannot be deleted, it will be ignored and it will not affect
         the response.
 
+        If the IDs are split into several requests and any of them fails, the other requests are still made and
+        may have been applied, leaving the work partly done. A `ChunkedRequestError` listing the IDs of the failed
+        requests is raised once all of them have finished.
+
         Args:
             tag_ids (list [str | int]): The list of IDs of the tags to delete.
+            chunk_size (int): The maximum number of IDs to send per request. Longer lists are split into several
+                requests. Must be at least 1. Defaults to 500.
+            max_concurrency (int): The maximum number of chunked requests to run at the same time. Must be at least
+                1 and is capped at the client's `pool_size`. Defaults to 8.
 
         Returns:
             (None): Doesn't return anything, if unsuccessful, will raise an exception.
         """
-        tag_ids = list_to_list_of_integers(tag_ids)
-        self.fetch_json(
-            "tags/delete", post_args={"tag_ids": tag_ids}, http_method="DELETE"
+        _check_chunking(chunk_size, max_concurrency)
+        post_args = {"tag_ids": list(dict.fromkeys(list_to_list_of_integers(tag_ids)))}
+        self.fetch_json_concurrently(
+            "tags/delete",
+            "DELETE",
+            _chunk_post_args(post_args, "tag_ids", chunk_size),
+            max_concurrency,
         )
 
     # Project related methods
@@ -425,7 +723,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of retrieved projects.
         """
-        params = GetNokoProjectsParameters(**kwargs).model_dump()
+        params = schemas.GetNokoProjectsParameters(**kwargs).model_dump()
         return self.fetch_json("projects", query_params=params, http_method="GET")
 
     def get_single_project(self, project_id: str | int) -> list[dict]:
@@ -455,7 +753,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The project created with the provided information as a dictionary.
         """
-        data = CreateNokoProjectParameters(**kwargs).model_dump()
+        data = schemas.CreateNokoProjectParameters(**kwargs).model_dump()
         return self.fetch_json("projects", post_args=data, http_method="POST")
 
     def get_all_entries_for_project(
@@ -494,11 +792,13 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): A list of all retrieved entries meeting the specified criteria.
         """
-        params = GetNokoEntriesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoEntriesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"projects/{project_id}/entries", query_params=params, http_method="GET"
         )
@@ -534,7 +834,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of all retrieved expenses meeting the specified criteria.
         """
-        params = GetNokoExpensesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoExpensesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"projects/{project_id}/expenses", query_params=params, http_method="GET"
         )
@@ -554,7 +854,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The edited project with the provided information as a dictionary.
         """
-        data = EditNokoProjectParameters(**kwargs).model_dump()
+        data = schemas.EditNokoProjectParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"projects/{project_id}", post_args=data, http_method="PUT"
         )
@@ -680,7 +980,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict] | None): The retrieved Noko project groups as a list of dictionaries.
         """
-        params = GetNokoProjectGroupsParameters(**kwargs).model_dump()
+        params = schemas.GetNokoProjectGroupsParameters(**kwargs).model_dump()
         return self.fetch_json("project_groups", query_params=params, http_method="GET")
 
     def create_project_group(self, **kwargs) -> list[dict]:
@@ -694,7 +994,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The newly created project group as a dictionary.
         """
-        params = CreateNokoProjectGroupsParameters(**kwargs).model_dump()
+        params = schemas.CreateNokoProjectGroupsParameters(**kwargs).model_dump()
         return self.fetch_json(
             "project_groups", query_params=params, http_method="POST"
         )
@@ -761,11 +1061,13 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): A list of all retrieved entries meeting the specified criteria.
         """
-        params = GetNokoEntriesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoEntriesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"project_groups/{project_group_id}/entries",
             query_params=params,
@@ -795,7 +1097,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of all retrieved projects meeting the specified criteria.
         """
-        params = GetNokoProjectsParameters(**kwargs).model_dump()
+        params = schemas.GetNokoProjectsParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"project_groups/{project_group_id}/projects",
             query_params=params,
@@ -937,7 +1239,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): All invoices matching the criteria as a list of dictionaries.
         """
-        params = GetNokoInvoicesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoInvoicesParameters(**kwargs).model_dump()
         return self.fetch_json("invoices", query_params=params, http_method="GET")
 
     def get_single_invoice(self, invoice_id: str | int) -> list[dict]:
@@ -999,7 +1301,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The created invoice as a dictionary.
         """
-        data = CreateNokoInvoiceParameters(**kwargs).model_dump()
+        data = schemas.CreateNokoInvoiceParameters(**kwargs).model_dump()
         return self.fetch_json("invoices", post_args=data, http_method="POST")
 
     def edit_invoice(self, invoice_id: str | int, **kwargs) -> list[dict]:
@@ -1050,7 +1352,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The edited invoice as a dictionary.
         """
-        data = EditNokoInvoiceParameters(**kwargs).model_dump()
+        data = schemas.EditNokoInvoiceParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"invoices/{invoice_id}", post_args=data, http_method="PUT"
         )
@@ -1111,11 +1413,13 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): A list of all retrieved entries meeting the specified criteria.
         """
-        params = GetNokoEntriesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoEntriesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"invoices/{invoice_id}/entries", query_params=params, http_method="GET"
         )
@@ -1151,7 +1455,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of all retrieved expenses meeting the specified criteria.
         """
-        params = GetNokoExpensesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoExpensesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"invoices/{invoice_id}/expenses", query_params=params, http_method="GET"
         )
@@ -1342,7 +1646,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): All retrieved expenses as a list of dictionaries.
         """
-        params = GetNokoExpensesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoExpensesParameters(**kwargs).model_dump()
         return self.fetch_json("expenses", query_params=params, http_method="GET")
 
     def get_single_expense(self, expense_id: str | int) -> list[dict]:
@@ -1374,7 +1678,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The newly created expense as a dictionary.
         """
-        data = CreateNokoExpenseParameters(**kwargs).model_dump()
+        data = schemas.CreateNokoExpenseParameters(**kwargs).model_dump()
         return self.fetch_json("expenses", post_args=data, http_method="POST")
 
     def edit_expense(self, expense_id: str | int, **kwargs) -> list[dict]:
@@ -1397,7 +1701,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The edited expense as a dictionary.
         """
-        data = EditNokoExpenseParameters(**kwargs).model_dump()
+        data = schemas.EditNokoExpenseParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"expenses/{expense_id}", post_args=data, http_method="PUT"
         )
@@ -1439,7 +1743,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of all users matching the specified criteria.
         """
-        params = GetNokoUsersParameters(**kwargs).model_dump()
+        params = schemas.GetNokoUsersParameters(**kwargs).model_dump()
         return self.fetch_json("users", query_params=params, http_method="GET")
 
     def get_single_user(self, user_id: int | str) -> list[dict]:
@@ -1487,11 +1791,13 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): A list of all retrieved entries meeting the specified criteria.
         """
-        params = GetNokoEntriesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoEntriesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"users/{user_id}/entries", query_params=params, http_method="GET"
         )
@@ -1527,7 +1833,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of all retrieved expenses meeting the specified criteria.
         """
-        params = GetNokoExpensesParameters(**kwargs).model_dump()
+        params = schemas.GetNokoExpensesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"users/{user_id}/expenses", query_params=params, http_method="GET"
         )
@@ -1547,7 +1853,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The created user's information as a dictionary.
         """
-        data = CreateNokoUserParameters(**kwargs).model_dump()
+        data = schemas.CreateNokoUserParameters(**kwargs).model_dump()
         return self.fetch_json("users", post_args=data, http_method="POST")
 
     def edit_user(self, user_id: str | int, **kwargs) -> list[dict]:
@@ -1565,7 +1871,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The edited user's information as a dictionary.
         """
-        data = EditNokoUserParameters(**kwargs).model_dump()
+        data = schemas.EditNokoUserParameters(**kwargs).model_dump()
         return self.fetch_json(f"users/{user_id}", post_args=data, http_method="PUT")
 
     def reactivate_user(self, user_id: str | int) -> None:
@@ -1695,7 +2001,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The list of teams in Noko as a list of dictionaries.
         """
-        params = GetNokoTeamsParameters(**kwargs).model_dump()
+        params = schemas.GetNokoTeamsParameters(**kwargs).model_dump()
         return self.fetch_json("teams", query_params=params, http_method="GET")
 
     def get_single_team(self, team_id: str | int) -> list[dict]:
@@ -1720,7 +2026,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): The created team as a dictionary.
         """
-        data = CreateNokoTeamParameters(**kwargs).model_dump()
+        data = schemas.CreateNokoTeamParameters(**kwargs).model_dump()
         return self.fetch_json("teams", post_args=data, http_method="POST")
 
     def edit_team(self, team_id: str | int, name: str) -> list[dict]:
@@ -1772,11 +2078,13 @@ class NokoClient(BaseClient):
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
             approved_at_to (str | datetime | None): Only entries with approvals up to this date will be returned.
                 If provided as string, must be in ISO 8601 format (YYYY-MM-DD). Defaults to None.
+            per_page (int | None): The number of entries to retrieve per page, up to 1000. All pages are always
+                retrieved, so larger pages mean fewer requests. Defaults to None, using Noko's default page size.
 
         Returns:
             (list[dict]): A list of all retrieved entries meeting the specified criteria.
         """
-        data = GetNokoEntriesParameters(**kwargs).model_dump()
+        data = schemas.GetNokoEntriesParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"teams/{team_id}/entries", post_args=data, http_method="GET"
         )
@@ -1801,7 +2109,7 @@ class NokoClient(BaseClient):
         Returns:
             (list[dict]): A list of all retrieved users meeting the specified criteria.
         """
-        data = GetNokoUsersParameters(**kwargs).model_dump()
+        data = schemas.GetNokoUsersParameters(**kwargs).model_dump()
         return self.fetch_json(
             f"teams/{team_id}/users", post_args=data, http_method="GET"
         )
@@ -0,0 +1,19 @@
+"""Exceptions for the Noko client."""
+from requests import HTTPError
+
+
+class ChunkedRequestError(HTTPError):
+    """Raised when some of the requests of a chunked bulk request fail.
+
+    Subclasses `requests.HTTPError`, so it is caught by the same handlers as a failed single request. The other
+    chunks may have been applied by Noko. You can access ``ex.failed_post_args`` to see the parameters (including
+    the IDs) of each chunk that failed, ``ex.errors`` for the matching exceptions, and ``ex.response`` for the
+    response of the first failed chunk, if it has one.
+    """
+
+    def __init__(
+        self, message: str, failed_post_args: list[dict], errors: list[BaseException]
+    ):
+        super().__init__(message, response=getattr(errors[0], "response", None))
+        self.failed_post_args = failed_post_args
+        self.errors = errors
@@ -1,39 +1,66 @@
 """Pydantic schemas to validate parameters before making requests."""
+# Schemas are imported on first access (PEP 562), so only the modules that are actually used get built.
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from noko_client.schemas.entries_parameters import (
-    CreateNokoEntryParameters,
-    EditNokoEntryParameters,
-    GetNokoEntriesParameters,
-)
-from noko_client.schemas.expenses_parameters import (
-    CreateNokoExpenseParameters,
-    EditNokoExpenseParameters,
-    GetNokoExpensesParameters,
-)
-from noko_client.schemas.invoice_parameters import (
-    CreateNokoInvoiceParameters,
-    EditNokoInvoiceParameters,
-    GetNokoInvoicesParameters,
-)
-from noko_client.schemas.project_groups_parameters import (
-    CreateNokoProjectGroupsParameters,
-    GetNokoProjectGroupsParameters,
-)
-from noko_client.schemas.projects_parameters import (
-    CreateNokoProjectParameters,
-    EditNokoProjectParameters,
-    GetNokoProjectsParameters,
-)
-from noko_client.schemas.tags_parameters import GetNokoTagsParameters
-from noko_client.schemas.teams_parameters import (
-    CreateNokoTeamParameters,
-    GetNokoTeamsParameters,
-)
-from noko_client.schemas.users_parameters import (
-    CreateNokoUserParameters,
-    EditNokoUserParameters,
-    GetNokoUsersParameters,
-)
+if TYPE_CHECKING:
+    from noko_client.schemas.entries_parameters import (
+        CreateNokoEntryParameters,
+        EditNokoEntryParameters,
+        GetNokoEntriesParameters,
+    )
+    from noko_client.schemas.expenses_parameters import (
+        CreateNokoExpenseParameters,
+        EditNokoExpenseParameters,
+        GetNokoExpensesParameters,
+    )
+    from noko_client.schemas.invoice_parameters import (
+        CreateNokoInvoiceParameters,
+        EditNokoInvoiceParameters,
+        GetNokoInvoicesParameters,
+    )
+    from noko_client.schemas.project_groups_parameters import (
+        CreateNokoProjectGroupsParameters,
+        GetNokoProjectGroupsParameters,
+    )
+    from noko_client.schemas.projects_parameters import (
+        CreateNokoProjectParameters,
+        EditNokoProjectParameters,
+        GetNokoProjectsParameters,
+    )
+    from noko_client.schemas.tags_parameters import GetNokoTagsParameters
+    from noko_client.schemas.teams_parameters import (
+        CreateNokoTeamParameters,
+        GetNokoTeamsParameters,
+    )
+    from noko_client.schemas.users_parameters import (
+        CreateNokoUserParameters,
+        EditNokoUserParameters,
+        GetNokoUsersParameters,
+    )
+
+_SCHEMA_MODULES = {
+    "CreateNokoEntryParameters": "entries_parameters",
+    "CreateNokoExpenseParameters": "expenses_parameters",
+    "CreateNokoInvoiceParameters": "invoice_parameters",
+    "CreateNokoProjectGroupsParameters": "project_groups_parameters",
+    "CreateNokoProjectParameters": "projects_parameters",
+    "CreateNokoTeamParameters": "teams_parameters",
+    "CreateNokoUserParameters": "users_parameters",
+    "EditNokoEntryParameters": "entries_parameters",
+    "EditNokoExpenseParameters": "expenses_parameters",
+    "EditNokoInvoiceParameters": "invoice_parameters",
+    "EditNokoProjectParameters": "projects_parameters",
+    "EditNokoUserParameters": "users_parameters",
+    "GetNokoEntriesParameters": "entries_parameters",
+    "GetNokoExpensesParameters": "expenses_parameters",
+    "GetNokoInvoicesParameters": "invoice_parameters",
+    "GetNokoProjectGroupsParameters": "project_groups_parameters",
+    "GetNokoProjectsParameters": "projects_parameters",
+    "GetNokoTagsParameters": "tags_parameters",
+    "GetNokoTeamsParameters": "teams_parameters",
+    "GetNokoUsersParameters": "users_parameters",
+}
 
 __all__ = [
     "CreateNokoEntryParameters",
@@ -57,3 +84,12 @@ __all__ = [
     "GetNokoTeamsParameters",
     "GetNokoUsersParameters",
 ]
+
+
+def __getattr__(name: str) -> type:
+    """Import and cache a schema the first time it is accessed."""
+    if name not in _SCHEMA_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_SCHEMA_MODULES[name]}"), name)
+    globals()[name] = value
+    return value
@@ -6,7 +6,7 @@ Pydantic schemas to process and validate parameters before making requests to th
 # mypy: disable-error-code=assignment
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from noko_client.schemas.validators import (
     format_booleans,
@@ -19,6 +19,8 @@ from noko_client.schemas.validators import (
 class BaseEntry(BaseModel):
     """Base model for actions related to entries."""
 
+    model_config = ConfigDict(frozen=True)
+
     date: str | datetime | None = None
     user_id: str | int | None = None
     minutes: int | None = None
@@ -39,8 +41,8 @@ class BaseEntry(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
 
 
 class CreateNokoEntryParameters(BaseEntry):
@@ -58,6 +60,8 @@ class EditNokoEntryParameters(BaseEntry):
 class GetNokoEntriesParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `entries` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     user_ids: str | list | None = None
     description: str | None = None
     project_ids: str | int | list | None = None
@@ -71,6 +75,7 @@ class GetNokoEntriesParameters(BaseModel):
     billable: bool | str | None = None
     approved_at_from: str | datetime | None = None
     approved_at_to: str | datetime | None = None
+    per_page: int | None = Field(default=None, ge=1, le=1000)
 
     @model_validator(mode="before")
     def set_from(cls, values: dict) -> dict:
@@ -98,6 +103,6 @@ class GetNokoEntriesParameters(BaseModel):
 
         Convert `from_` property to expected `from` key and remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        data["from"] = data.pop("from_")
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["by_alias"] = True
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
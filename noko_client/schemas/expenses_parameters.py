@@ -5,7 +5,7 @@ Pydantic schemas to process and validate parameters before making requests to th
 # pylint: disable=no-self-argument
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from noko_client.schemas.validators import format_booleans, format_date, format_id_lists
 
@@ -13,6 +13,8 @@ from noko_client.schemas.validators import format_booleans, format_date, format_
 class ExpenseBase(BaseModel):
     """Base model for expense create and edit schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     date: str | datetime | None = None
     project_id: str | int | None = None
     price: int | float | None = None
@@ -29,8 +31,8 @@ class ExpenseBase(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
 
 
 class CreateNokoExpenseParameters(ExpenseBase):
@@ -48,6 +50,8 @@ class EditNokoExpenseParameters(ExpenseBase):
 class GetNokoExpensesParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `expenses` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     user_ids: str | list | None = None
     description: str | None = None
     project_ids: str | list | None = None
@@ -72,6 +76,6 @@ class GetNokoExpensesParameters(BaseModel):
 
         Convert `from_` property to expected `from` key and remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        data["from"] = data.pop("from_")
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["by_alias"] = True
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
@@ -6,7 +6,7 @@ Pydantic schemas to process and validate parameters before making requests to th
 # mypy: disable-error-code=assignment
 from datetime import datetime
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from pydantic_core import ValidationError
 
 from noko_client.schemas.validators import (
@@ -24,6 +24,8 @@ VALID_STATE = ("unpaid", "awaiting_payment", "in_progress", "paid", "none")
 class CreateNokoInvoiceParameters(BaseModel):
     """Process and validate parameters to make POST requests to the `invoices` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     invoice_date: str | datetime
     reference: str | None = None
     project_name: str | None = None
@@ -108,8 +110,8 @@ class CreateNokoInvoiceParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
 
 
 class EditNokoInvoiceParameters(CreateNokoInvoiceParameters):
@@ -121,6 +123,8 @@ class EditNokoInvoiceParameters(CreateNokoInvoiceParameters):
 class GetNokoInvoicesParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `invoices` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     state: str | None = None
     reference: str | None = None
     invoice_date_from: str | datetime | None = None
@@ -189,5 +193,5 @@ class GetNokoInvoicesParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
@@ -4,7 +4,7 @@ Pydantic schemas to process and validate parameters before making requests to th
 of the Noko API.
 """
 # pylint: disable=no-self-argument
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from noko_client.schemas.validators import format_id_lists
 
@@ -12,6 +12,8 @@ from noko_client.schemas.validators import format_id_lists
 class CreateNokoProjectGroupsParameters(BaseModel):
     """Process and validate parameters to make POST requests to the `project_groups` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     project_ids: str | int | list
 
@@ -22,13 +24,15 @@ class CreateNokoProjectGroupsParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
 
 
 class GetNokoProjectGroupsParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `project_groups` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     project_ids: str | int | list | None = None
 
@@ -39,5 +43,5 @@ class GetNokoProjectGroupsParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
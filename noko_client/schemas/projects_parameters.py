@@ -3,7 +3,7 @@
 Pydantic schemas to process and validate parameters before making requests to the `projects` endpoint of the Noko API.
 """
 # pylint: disable=no-self-argument
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from pydantic_core import ValidationError
 
 from noko_client.schemas.validators import format_booleans, format_id_lists
@@ -26,6 +26,8 @@ def validate_billing_increment(value: int | None) -> int | None:
 class ProjectBase(BaseModel):
     """Base model for project create and edit schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     project_group_id: str | int | None = None
     billing_increment: int | None = None
@@ -45,8 +47,8 @@ class ProjectBase(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
 
 
 class CreateNokoProjectParameters(ProjectBase):
@@ -65,6 +67,8 @@ class EditNokoProjectParameters(ProjectBase):
 class GetNokoProjectsParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `projects` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     project_group_ids: str | list | None = None
     billing_increment: int | None = None
@@ -84,5 +88,5 @@ class GetNokoProjectsParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
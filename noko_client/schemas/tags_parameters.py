@@ -3,7 +3,7 @@
 Pydantic schemas to process and validate parameters before making requests to the `tags` endpoint of the Noko API.
 """
 # pylint: disable=no-self-argument
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from noko_client.schemas.validators import format_booleans
 
@@ -11,6 +11,8 @@ from noko_client.schemas.validators import format_booleans
 class GetNokoTagsParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `tags` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     billable: str | bool | None = None
 
@@ -21,5 +23,5 @@ class GetNokoTagsParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
@@ -3,7 +3,7 @@
 Pydantic schemas to process and validate parameters before making requests to the `teams` endpoint of the Noko API.
 """
 # pylint: disable=no-self-argument
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from noko_client.schemas.validators import format_id_lists
 
@@ -11,6 +11,8 @@ from noko_client.schemas.validators import format_id_lists
 class BaseTeam(BaseModel):
     """Base model for the actions related to the `team` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     user_ids: str | int | list | None = None
 
@@ -21,8 +23,8 @@ class BaseTeam(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
 
 
 class CreateNokoTeamParameters(BaseTeam):
@@ -2,7 +2,7 @@
 
 Pydantic schemas to process and validate parameters before making requests to the `users` endpoint of the Noko API.
 """
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from pydantic_core import ValidationError
 
 VALID_ROLE: tuple = ("supervisor", "leader", "coworker", "contractor")
@@ -26,6 +26,8 @@ def validate_state(value: str | None) -> str | None:
 class BaseUser(BaseModel):
     """Base user for Noko user actions."""
 
+    model_config = ConfigDict(frozen=True)
+
     first_name: str | None = None
     last_name: str | None = None
     role: str | None = None
@@ -47,6 +49,8 @@ class EditNokoUserParameters(BaseUser):
 class GetNokoUsersParameters(BaseModel):
     """Process and validate parameters to make GET requests to the `users` endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str | None = None
     email: str | None = None
     role: str | None = None
@@ -61,5 +65,5 @@ class GetNokoUsersParameters(BaseModel):
 
         Remove None values from the dictionary.
         """
-        data = super().model_dump(**kwargs)
-        return {key: value for key, value in data.items() if value is not None}
+        kwargs["exclude_none"] = True
+        return super().model_dump(**kwargs)
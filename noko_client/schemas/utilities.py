@@ -1,6 +1,13 @@
 """Common utilities shared by the client's methods."""
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timezone
+
+from dateutil.parser import parse
+
+# Strings already in the exact format Noko expects, which only need validating and not reformatting.
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", re.ASCII)
 
 
 def boolean_as_lower_string(value: bool | str | None) -> str | None:
@@ -11,17 +18,28 @@ def boolean_as_lower_string(value: bool | str | None) -> str | None:
 
 
 def date_to_string(date: datetime | str) -> str:
-    """Convert datetime object to ISO 8601 string."""
+    """Convert datetime object or date string to ISO 8601 string."""
+    if isinstance(date, str) and _ISO_DATE_RE.fullmatch(date):
+        datetime.fromisoformat(date)
+        return date
+    if isinstance(date, str):
+        date = string_to_datetime(date)
     if isinstance(date, datetime):
         date = date.strftime("%Y-%m-%d")
     return date
 
 
-def list_to_list_of_integers(value: list) -> list:
-    """Turn a list into a list of integers.
+def list_to_list_of_integers(value: list | str) -> list:
+    """Turn a list or a comma separated string into a list of integers.
 
     If an object in the list cannot be converted to an integer, it will be removed from the resulting list.
     """
+    if isinstance(value, str):
+        value = value.split(",")
+    try:
+        return list(map(int, value))
+    except (TypeError, ValueError):
+        pass
     result = []
     for item in value:
         try:
@@ -36,8 +54,27 @@ def list_to_string(value: list) -> str:
     return ",".join([str(item) for item in value])
 
 
+def string_to_datetime(value: str) -> datetime:
+    """Parse a date or timestamp string into a datetime object, keeping any timezone it includes.
+
+    ISO 8601 strings are handled by `datetime.fromisoformat`, falling back to `dateutil` for any other format.
+    Raises `ValueError` if the string cannot be parsed.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return parse(value)
+
+
 def timestamp_to_string(timestamp: datetime | str | None) -> str | None:
-    """Convert a datetime object to an ISO 8601 timestamp string."""
+    """Convert a datetime object or timestamp string to an ISO 8601 timestamp string in UTC."""
+    if isinstance(timestamp, str) and _ISO_TIMESTAMP_RE.fullmatch(timestamp):
+        datetime.fromisoformat(timestamp[:-1])
+        return timestamp
+    if isinstance(timestamp, str):
+        timestamp = string_to_datetime(timestamp)
+    if isinstance(timestamp, datetime) and timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
     if isinstance(timestamp, datetime):
         timestamp = f"{timestamp.replace(microsecond=0).isoformat()}Z"
     return timestamp
@@ -1,8 +1,6 @@
 """Reusable validators for multiple Pydantic schemas."""
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from noko_client.schemas.utilities import (
     boolean_as_lower_string,
     date_to_string,
@@ -18,10 +16,13 @@ def format_booleans(value: bool | str | None) -> str | None:
 
 
 def format_date(value: str | datetime) -> str:
-    """If date provided as datetime, convert to string. If provided as string, validate for ISO 8601."""
-    if isinstance(value, str):
-        parse(value)
-    return date_to_string(value) if isinstance(value, datetime) else value
+    """Format a date parameter as the YYYY-MM-DD string expected by Noko.
+
+    Datetimes are formatted directly. Strings already in YYYY-MM-DD format are validated and kept as they are. Any
+    other string is parsed (as ISO 8601 first, then by `dateutil`) and converted to its calendar date, so for example
+    "2023-01-05T10:00:00" becomes "2023-01-05" and "01/02/2023" is read month first as "2023-01-02".
+    """
+    return date_to_string(value)
 
 
 def format_id_lists(value: str | int | list | None) -> str | None:
@@ -38,6 +39,4 @@ def format_list_of_integers(value: list | None) -> list | None:
 
 def format_timestamps(value: str | datetime | None) -> str | None:
     """Format a timestamp into ISO 8601 format."""
-    if isinstance(value, str):
-        value = parse(value.split("Z")[0])
-    return timestamp_to_string(value) if isinstance(value, datetime) else value
+    return timestamp_to_string(value)
@@ -70,5 +70,6 @@ setup(
     install_requires=install_requires,
     extras_require={
         "dev": dev_requires,
+        "orjson": ["orjson"],
     },
 )